@@ -1,11 +1,17 @@
 from collections import UserDict, OrderedDict
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from _collections_abc import (
     dict_keys,
     dict_values,
     dict_items,
 )  # https://github.com/python/typeshed/pull/6888
-from .helpers import _is_iterable_but_not_string, _convert_slice_to_list
+from .helpers import (
+    _is_iterable_but_not_string,
+    _convert_slice_to_list,
+    _is_predicate,
+    _convert_predicate_to_set,
+    _combine_as_tuple,
+)
 
 
 class kdict(UserDict):
@@ -31,14 +37,23 @@ class kdict(UserDict):
 
         super().__init__(dict, **kwargs)
 
-    def _get_multiple_keys(self, key_template):
-        # TODO: can we return a view into the dictionary rather than a copy?
-        # see https://stackoverflow.com/q/9329537/130164
+    @classmethod
+    def _from_data(cls, data, key_len):
+        # Bulk-construct from a plain dict whose keys are already known to have length key_len,
+        # skipping the per-entry validation in __init__ and __setitem__
+        result = cls()
+        result.data = data
+        result.key_len = key_len if data else None
+        return result
+
+    def _expand_key_template(self, key_template, dimensions):
+        # Turn scalars, lists, and slices at the requested dimensions into equal-length lists, to be zipped together into candidate keys
 
         key_transformed = []
 
         # Convert slices to list
-        for ix, k in enumerate(key_template):
+        for ix in dimensions:
+            k = key_template[ix]
             if isinstance(k, slice):
                 key_transformed.append(
                     _convert_slice_to_list(k, self.keys(dimensions=ix, unique=False))
@@ -48,7 +63,7 @@ class kdict(UserDict):
             else:
                 key_transformed.append(k)
 
-        if len(key_transformed) != len(key_template):
+        if len(key_transformed) != len(dimensions):
             raise ValueError("something went wrong in slice eval process")
 
         # confirm all list lengths match
@@ -60,18 +75,67 @@ class kdict(UserDict):
             raise KeyError("All slices must have same length")
 
         # transform any remaining scalars into lists of that length
-        key_transformed = [
-            [k] * key_list_lengths[0] if (not _is_iterable_but_not_string(k)) else k
+        # (if there are only scalars, there is a single candidate key)
+        target_length = key_list_lengths[0] if key_list_lengths else 1
+        return [
+            [k] * target_length if (not _is_iterable_but_not_string(k)) else k
             for k in key_transformed
         ]
 
-        # take subset
-        # check membership against keys() to handle the following scenario:
-        # suppose we have keys (1, "a"), (1, "b"), (2, "c"), and user asks for (1, :)
-        # in this case, key_transformed will include (1, "c"), which does not actually exist
-        # this is tested in test_none_slice_against_mixed_column()
-        # TODO: is there a better way to construct key_transformed?
-        subset = {k: self.data[k] for k in zip(*key_transformed) if k in self.keys()}
+    def _get_multiple_keys(self, key_template):
+        # TODO: can we return a view into the dictionary rather than a copy?
+        # see https://stackoverflow.com/q/9329537/130164
+
+        # Resolve predicates (sets, callables, boolean masks) into sets of allowed values per dimension
+        allowed_values = {}
+        for ix, k in enumerate(key_template):
+            if isinstance(k, (set, frozenset)):
+                allowed_values[ix] = k
+            elif _is_predicate(k):
+                unique_values = self.keys(dimensions=ix, unique=True)
+                if callable(k) and k in unique_values:
+                    # functions can be key values themselves, in which case this is not a predicate
+                    continue
+                allowed_values[ix] = _convert_predicate_to_set(k, unique_values)
+        other_dimensions = [
+            ix for ix in range(len(key_template)) if ix not in allowed_values
+        ]
+
+        if not allowed_values and not any(
+            isinstance(k, slice) or _is_iterable_but_not_string(k) for k in key_template
+        ):
+            # every callable was a key value, so this is a lookup of a single key
+            return super().__getitem__(key_template)
+
+        if not allowed_values:
+            key_transformed = self._expand_key_template(key_template, other_dimensions)
+
+            # take subset
+            # check membership against keys() to handle the following scenario:
+            # suppose we have keys (1, "a"), (1, "b"), (2, "c"), and user asks for (1, :)
+            # in this case, key_transformed will include (1, "c"), which does not actually exist
+            # this is tested in test_none_slice_against_mixed_column()
+            # TODO: is there a better way to construct key_transformed?
+            subset = {
+                k: self.data[k] for k in zip(*key_transformed) if k in self.keys()
+            }
+        else:
+            # Predicates filter each dimension independently, so scan the keys once with hashed membership checks.
+            # Any remaining scalars, lists, and slices are zipped into allowed combinations of the other dimensions.
+            allowed_others = (
+                set(zip(*self._expand_key_template(key_template, other_dimensions)))
+                if other_dimensions
+                else None
+            )
+            subset = {
+                k: v
+                for k, v in self.data.items()
+                if all(k[ix] in allowed for ix, allowed in allowed_values.items())
+                and (
+                    allowed_others is None
+                    or tuple(k[ix] for ix in other_dimensions) in allowed_others
+                )
+            }
 
         # Return another kdict
         return self.__class__(dict=subset)
@@ -80,13 +144,25 @@ class kdict(UserDict):
         if self.key_len is not None and len(key) != self.key_len:
             raise KeyError(key, "wrong key length")
 
-        if any(isinstance(k, slice) or _is_iterable_but_not_string(k) for k in key):
+        # exact matches take priority, so that classes and functions used as key values are not mistaken for predicates
+        try:
+            if key in self.data:
+                return self.data[key]
+        except TypeError:
+            # unhashable selectors, such as lists or sets
+            pass
+
+        if any(
+            isinstance(k, slice) or _is_iterable_but_not_string(k) or _is_predicate(k)
+            for k in key
+        ):
             return self._get_multiple_keys(key)
 
         return super().__getitem__(key)
 
     def __setitem__(self, key, value):
-        if not self.key_len:
+        # compare against None, since squeezing every dimension leaves a key_len of 0
+        if self.key_len is None:
             self.key_len = len(key)
         else:
             if len(key) != self.key_len:
@@ -134,5 +210,163 @@ class kdict(UserDict):
             self.data.items()
         )  # instead of return super().items() or not overriding at all
 
+    def join(self, other, on, how="inner", combine=None):
+        """
+        Join with another kdict on shared key dimensions, using a hash index on the join dimensions of the other kdict.
+
+        `on` maps dimensions of this kdict to dimensions of the other, e.g. {0: 0, 1: 1}. A single dimension or a list of dimensions is treated as the same dimensions on both sides.
+        Keys of the result are this kdict's keys followed by the other kdict's non-join dimensions.
+        Values are (value, other_value) tuples, or combine(value, other_value) if a combine function is provided.
+
+        With how="left", keys of this kdict without a match are kept, with None for the other kdict's dimensions and value.
+        """
+        if how not in ("inner", "left"):
+            raise ValueError("how must be 'inner' or 'left'")
+        if combine is None:
+            combine = _combine_as_tuple
+
+        if not isinstance(on, dict):
+            # a single dimension or a list of dimensions, shared by both sides
+            dimensions = on if isinstance(on, Iterable) else [on]
+            on = {dimension: dimension for dimension in dimensions}
+        own_dimensions = list(on.keys())
+        other_dimensions = list(on.values())
+
+        for dimensions, key_len in [
+            (own_dimensions, self.key_len),
+            (other_dimensions, other.key_len),
+        ]:
+            if key_len is not None and any(not 0 <= ix < key_len for ix in dimensions):
+                raise ValueError("on must refer to existing key dimensions")
+
+        # dimensions of the other kdict that are not joined on get appended to the result keys
+        extra_dimensions = [
+            ix for ix in range(other.key_len or 0) if ix not in other_dimensions
+        ]
+
+        # build hash index on the other kdict's join dimensions
+        index = {}
+        for other_key, other_value in other.items():
+            index.setdefault(
+                tuple(other_key[ix] for ix in other_dimensions), []
+            ).append((tuple(other_key[ix] for ix in extra_dimensions), other_value))
+
+        unmatched = [((None,) * len(extra_dimensions), None)]
+        joined = {}
+        for key, value in self.data.items():
+            matches = index.get(tuple(key[ix] for ix in own_dimensions))
+            if matches is None:
+                if how == "inner":
+                    continue
+                matches = unmatched
+            for extra_key, other_value in matches:
+                joined[key + extra_key] = combine(value, other_value)
+
+        # Return another kdict
+        return self._from_data(
+            joined,
+            None if self.key_len is None else self.key_len + len(extra_dimensions),
+        )
+
+    def _normalize_dimension(self, dimension, num_dimensions=None):
+        # Support negative dimensions like tuple indexing does, and reject out-of-range ones
+        if num_dimensions is None:
+            num_dimensions = self.key_len
+        if not -num_dimensions <= dimension < num_dimensions:
+            raise ValueError(f"Dimension {dimension} is out of range")
+        return dimension % num_dimensions
+
+    def transpose(self, order):
+        """
+        Reorder key dimensions, e.g. transpose([2, 0, 1]) makes the last dimension the leading one.
+        """
+        if self.key_len is None:
+            return self._from_data({}, None)
+
+        order = [self._normalize_dimension(ix) for ix in order]
+        if sorted(order) != list(range(self.key_len)):
+            raise ValueError("order must be a permutation of the key dimensions")
+        return self._from_data(
+            {tuple(key[ix] for ix in order): value for key, value in self.data.items()},
+            self.key_len,
+        )
+
+    def squeeze(self, dimension=None):
+        """
+        Drop a key dimension that has a single unique value, e.g. after slicing d[0, :, :].
+        If no dimension is given, drop all dimensions that have a single unique value.
+        """
+        if self.key_len is None:
+            return self._from_data({}, None)
+
+        if dimension is None:
+            dimensions = [
+                ix
+                for ix in range(self.key_len)
+                if len(self.keys(dimensions=ix, unique=True)) == 1
+            ]
+        else:
+            dimensions = [
+                self._normalize_dimension(ix)
+                for ix in (
+                    dimension if isinstance(dimension, Iterable) else [dimension]
+                )
+            ]
+            if any(
+                len(self.keys(dimensions=ix, unique=True)) != 1 for ix in dimensions
+            ):
+                raise ValueError(
+                    "Can only squeeze dimensions that have a single unique value"
+                )
+
+        kept_dimensions = [ix for ix in range(self.key_len) if ix not in dimensions]
+        return self._from_data(
+            {
+                tuple(key[ix] for ix in kept_dimensions): value
+                for key, value in self.data.items()
+            },
+            len(kept_dimensions),
+        )
+
+    def unstack(self, dimension):
+        """
+        Move a key dimension into the values: returns a kdict keyed by the remaining dimensions,
+        whose values are dicts mapping the unstacked dimension's values to the original values.
+        """
+        if self.key_len is None:
+            return self._from_data({}, None)
+
+        dimension = self._normalize_dimension(dimension)
+        kept_dimensions = [ix for ix in range(self.key_len) if ix != dimension]
+        unstacked = {}
+        for key, value in self.data.items():
+            outer_key = tuple(key[ix] for ix in kept_dimensions)
+            unstacked.setdefault(outer_key, {})[key[dimension]] = value
+        return self._from_data(unstacked, len(kept_dimensions))
+
+    def stack(self, dimension=None):
+        """
+        Inverse of unstack: expand dict values into a new key dimension, inserted at position `dimension` (default: last).
+        """
+        if self.key_len is None:
+            return self._from_data({}, None)
+        if dimension is None:
+            dimension = self.key_len
+        # the new dimension can go anywhere from before the first to after the last existing dimension
+        dimension = self._normalize_dimension(dimension, self.key_len + 1)
+        if not all(isinstance(inner, Mapping) for inner in self.data.values()):
+            raise ValueError(
+                "stack requires all values to be dicts, as made by unstack"
+            )
+
+        return self._from_data(
+            {
+                key[:dimension] + (inner_key,) + key[dimension:]: value
+                for key, inner in self.data.items()
+                for inner_key, value in inner.items()
+            },
+            self.key_len + 1,
+        )
+
     def eject(self):
         return self.data
@@ -22,3 +22,46 @@ def _convert_slice_to_list(s, lst):
         )
         or (not s.start and not s.stop)
     ]
+
+
+def _is_boolean_mask(obj):
+    # duck-type numpy boolean arrays without importing numpy.
+    # zero-dimensional values like numpy.bool_ are scalars, not masks
+    dtype = getattr(obj, "dtype", None)
+    return (
+        dtype is not None
+        and getattr(dtype, "kind", None) == "b"
+        and getattr(obj, "ndim", 1) != 0
+    )
+
+
+def _is_predicate(obj):
+    # predicates filter a single dimension independently of the others,
+    # as opposed to lists, which are zipped together across dimensions.
+    # classes are callable too, but are treated as key values, never called as predicates
+    return (
+        isinstance(obj, (set, frozenset))
+        or (callable(obj) and not isinstance(obj, type))
+        or _is_boolean_mask(obj)
+    )
+
+
+def _convert_predicate_to_set(predicate, unique_values):
+    # resolve a predicate into the set of allowed values for one dimension.
+    # callables and masks are evaluated against unique values only, so cost scales with dimension cardinality, not number of entries
+    if isinstance(predicate, (set, frozenset)):
+        return predicate
+    if _is_boolean_mask(predicate):
+        if getattr(predicate, "ndim", 1) != 1:
+            raise KeyError("Boolean mask must be one-dimensional")
+        if len(predicate) != len(unique_values):
+            raise KeyError(
+                "Boolean mask must have one entry per unique value in the dimension"
+            )
+        return {value for value, keep in zip(unique_values, predicate) if keep}
+    return {value for value in unique_values if predicate(value)}
+
+
+def _combine_as_tuple(value, other_value):
+    # default way to combine values when joining kdicts
+    return (value, other_value)
@@ -1,4 +1,24 @@
-from kdict.helpers import _is_iterable_but_not_string
+import pytest
+from kdict.helpers import (
+    _is_iterable_but_not_string,
+    _is_predicate,
+    _convert_predicate_to_set,
+    _is_boolean_mask,
+)
+
+
+class FakeDtype:
+    def __init__(self, kind):
+        self.kind = kind
+
+
+class FakeArray(list):
+    """Duck-typed stand-in for a numpy array, so masks can be tested without numpy."""
+
+    def __init__(self, values, kind="b", ndim=1):
+        super().__init__(values)
+        self.dtype = FakeDtype(kind)
+        self.ndim = ndim
 
 
 def test_is_iterable_but_not_string():
@@ -8,3 +28,40 @@ def test_is_iterable_but_not_string():
     assert _is_iterable_but_not_string((1, 2, 3))
     assert not _is_iterable_but_not_string("str")
     assert not _is_iterable_but_not_string(5)
+
+
+def test_is_predicate():
+    assert _is_predicate({1, 2})
+    assert _is_predicate(frozenset([1, 2]))
+    assert _is_predicate(lambda x: x > 1)
+    assert not _is_predicate(int)
+    assert not _is_predicate([1, 2])
+    assert not _is_predicate(slice(None))
+    assert not _is_predicate("str")
+    assert not _is_predicate(5)
+
+
+def test_convert_predicate_to_set():
+    assert _convert_predicate_to_set({1, 2}, [1, 3]) == {1, 2}
+    assert _convert_predicate_to_set(lambda x: x > 1, [1, 2, 3]) == {2, 3}
+
+
+def test_is_boolean_mask():
+    assert _is_boolean_mask(FakeArray([True, False]))
+    assert not _is_boolean_mask(FakeArray([1, 2], kind="i"))
+    assert not _is_boolean_mask([True, False])
+    # zero-dimensional booleans, like numpy.bool_, are scalars
+    assert not _is_boolean_mask(FakeArray([], ndim=0))
+    assert _is_predicate(FakeArray([True, False]))
+
+
+def test_convert_boolean_mask_to_set():
+    assert _convert_predicate_to_set(FakeArray([True, False, True]), [1, 2, 3]) == {
+        1,
+        3,
+    }
+    with pytest.raises(KeyError):
+        _convert_predicate_to_set(FakeArray([True, False]), [1, 2, 3])
+    # multi-dimensional masks are rejected
+    with pytest.raises(KeyError):
+        _convert_predicate_to_set(FakeArray([True, False, True], ndim=2), [1, 2, 3])
@@ -2,6 +2,7 @@
 
 import pytest
 from kdict import kdict
+from tests.test_helpers import FakeArray
 
 
 def test_main():
@@ -235,3 +236,300 @@ def test_looks_like_a_dict():
     assert type(d.keys()) == type(d.data.keys())
     assert type(d.values()) == type(d.data.values())
     assert type(d.items()) == type(d.data.items())
+
+
+def test_set_selector():
+    d = kdict()
+    for fold_id in range(5):
+        for model_name in ["randomforest", "svm"]:
+            d[fold_id, model_name] = object()
+    subset = d[{1, 3, 10}, :]
+    assert type(subset) == kdict
+    assert set(subset.keys()) == {
+        (1, "randomforest"),
+        (1, "svm"),
+        (3, "randomforest"),
+        (3, "svm"),
+    }
+    assert len(d[{1, 3}, "svm"]) == 2
+    assert len(d[frozenset([0]), {"svm", "lasso"}]) == 1
+
+
+def test_callable_selector_evaluated_once_per_unique_value():
+    d = kdict()
+    for fold_id in range(3):
+        for fold_label in ["train", "test"]:
+            for model_name in ["randomforest", "svm"]:
+                d[fold_id, fold_label, model_name] = object()
+
+    calls = []
+
+    def predicate(fold_id):
+        calls.append(fold_id)
+        return fold_id >= 1
+
+    subset = d[predicate, "train", :]
+    assert len(subset) == 4
+    assert subset.keys(dimensions=0) == [1, 2]
+    assert subset.keys(dimensions=1) == ["train"]
+    # evaluated against unique values, not once per entry
+    assert calls == [0, 1, 2]
+
+    assert len(d[lambda fold_id: fold_id == 2, :, lambda m: m.endswith("m")]) == 2
+
+
+def test_predicate_selector_with_list():
+    d = kdict()
+    d[1, 2, "train"] = object()
+    d[1, 5, "train"] = object()
+    d[1, 10, "train"] = object()
+    d[1, 10, "test"] = object()
+    d[2, 10, "test"] = object()
+    # lists are still zipped together; the predicate filters independently
+    assert set(d[lambda x: x < 2, [5, 10], ["train", "test"]].keys()) == {
+        (1, 5, "train"),
+        (1, 10, "test"),
+    }
+
+
+def test_exact_lookup_with_callable_key_values():
+    class Model:
+        pass
+
+    def scorer():
+        pass
+
+    d = kdict({(Model, "train"): 1, (scorer, "a"): 2})
+    assert d[Model, "train"] == 1
+    assert d[scorer, "a"] == 2
+    # a callable that is a key value is treated as a value, not a predicate, when slicing too
+    assert set(d[Model, :].keys()) == {(Model, "train")}
+    with pytest.raises(KeyError):
+        d[Model, "test"]
+
+
+def test_missing_class_key_value_is_not_called():
+    class A:
+        pass
+
+    class B:
+        pass
+
+    class C:
+        pass
+
+    d = kdict({(A, "train"): 1, (B, "train"): 2})
+    assert len(d[C, :]) == 0
+    assert len(d[:, A]) == 0
+
+    types = kdict({(int, "a"): 1, (float, "b"): 2})
+    assert len(types[str, :]) == 0
+    assert dict(types[int, :]) == {(int, "a"): 1}
+
+
+def test_fake_boolean_mask_selector():
+    d = kdict()
+    d[1, "train"] = 1
+    d[5, "train"] = 2
+    d[10, "test"] = 3
+    subset = d[FakeArray([False, True, True]), :]
+    assert set(subset.keys()) == {(5, "train"), (10, "test")}
+
+    with pytest.raises(KeyError):
+        d[FakeArray([True, False]), :]
+
+
+def test_boolean_mask_selector():
+    np = pytest.importorskip("numpy")
+    d = kdict()
+    d[1, "train"] = object()
+    d[5, "train"] = object()
+    d[10, "train"] = object()
+    d[10, "test"] = object()
+
+    unique_values = np.array(d.keys(dimensions=0))
+    subset = d[unique_values > 3, :]
+    assert set(subset.keys()) == {(5, "train"), (10, "train"), (10, "test")}
+
+    with pytest.raises(KeyError):
+        d[np.array([True, False]), :]
+
+    # numpy booleans used as key values are scalars, not masks
+    bools = kdict({(np.True_, "a"): 1, (np.False_, "b"): 2})
+    assert dict(bools[np.True_, :]) == {(np.True_, "a"): 1}
+
+
+def test_join_inner():
+    scores = kdict()
+    runtimes = kdict()
+    for fold_id in range(2):
+        for model_name in ["randomforest", "svm"]:
+            scores[fold_id, model_name] = fold_id + 0.5
+            for hardware in ["cpu", "gpu"]:
+                runtimes[model_name, fold_id, hardware] = hardware
+    # fold without runtimes should be dropped
+    scores[5, "svm"] = 0.1
+
+    joined = scores.join(runtimes, on={0: 1, 1: 0})
+    assert type(joined) == kdict
+    assert len(joined) == 8
+    assert joined.key_len == 3
+    assert joined[1, "svm", "gpu"] == (1.5, "gpu")
+    assert (5, "svm", "cpu") not in joined.keys()
+
+
+def test_join_left_with_combine():
+    scores = kdict({(0, "svm"): 1, (1, "svm"): 2, (2, "svm"): 3})
+    weights = kdict({(0, "svm"): 10, (1, "svm"): 20})
+
+    joined = scores.join(weights, on=[0, 1], how="left")
+    assert joined.key_len == 2
+    assert joined[0, "svm"] == (1, 10)
+    assert joined[2, "svm"] == (3, None)
+
+    combined = scores.join(
+        weights,
+        on=[0, 1],
+        how="inner",
+        combine=lambda score, weight: score * weight,
+    )
+    assert dict(combined) == {(0, "svm"): 10, (1, "svm"): 40}
+
+
+def test_join_left_pads_missing_dimensions():
+    scores = kdict({(0, "svm"): 1, (1, "svm"): 2})
+    runtimes = kdict({(0, "svm", "cpu"): 5})
+    joined = scores.join(runtimes, on={0: 0, 1: 1}, how="left")
+    assert dict(joined) == {(0, "svm", "cpu"): (1, 5), (1, "svm", None): (2, None)}
+
+
+def test_join_invalid_how():
+    with pytest.raises(ValueError):
+        kdict({(0, 1): 1}).join(kdict({(0, 1): 1}), on=[0], how="outer")
+
+
+def test_join_on_single_dimension():
+    scores = kdict({(0, "svm"): 1, (1, "svm"): 2})
+    folds = kdict({(0,): "a", (1,): "b"})
+    joined = scores.join(folds, on=0)
+    assert type(joined) == kdict
+    assert joined.key_len == 2
+    assert dict(joined) == {(0, "svm"): (1, "a"), (1, "svm"): (2, "b")}
+
+
+def test_join_invalid_on():
+    d = kdict({(0, "svm"): 1})
+    with pytest.raises(ValueError):
+        d.join(d, on={0: 5})
+    with pytest.raises(ValueError):
+        d.join(d, on={5: 0})
+    with pytest.raises(ValueError):
+        d.join(d, on=[-1])
+
+
+def test_join_empty():
+    d = kdict({(0, "svm"): 1})
+    assert len(d.join(kdict(), on=[0])) == 0
+    assert dict(d.join(kdict(), on=[0], how="left")) == {(0, "svm"): (1, None)}
+    assert len(kdict().join(d, on=[0])) == 0
+
+
+def test_transpose():
+    d = kdict()
+    d[0, "train", "svm"] = 1
+    d[1, "test", "lasso"] = 2
+    transposed = d.transpose([2, 0, 1])
+    assert type(transposed) == kdict
+    assert transposed.key_len == 3
+    assert dict(transposed) == {("svm", 0, "train"): 1, ("lasso", 1, "test"): 2}
+    assert len(transposed["svm", :, :]) == 1
+
+    with pytest.raises(ValueError):
+        d.transpose([0, 0, 1])
+
+
+def test_squeeze():
+    d = kdict()
+    for fold_id in range(2):
+        for model_name in ["randomforest", "svm"]:
+            d[fold_id, "train", model_name] = fold_id
+
+    squeezed = d[0, :, :].squeeze(0)
+    assert squeezed.key_len == 2
+    assert set(squeezed.keys()) == {("train", "randomforest"), ("train", "svm")}
+
+    # squeeze all dimensions with a single value
+    assert set(d[:, :, "svm"].squeeze().keys()) == {(0,), (1,)}
+
+    with pytest.raises(ValueError):
+        d.squeeze(2)
+
+
+def test_stack_unstack():
+    d = kdict()
+    for fold_id in range(2):
+        for model_name in ["randomforest", "svm"]:
+            d[fold_id, model_name] = (fold_id, model_name)
+
+    unstacked = d.unstack(1)
+    assert unstacked.key_len == 1
+    assert unstacked[(0,)] == {"randomforest": (0, "randomforest"), "svm": (0, "svm")}
+
+    restacked = unstacked.stack(1)
+    assert type(restacked) == kdict
+    assert restacked.key_len == 2
+    assert dict(restacked) == dict(d)
+
+    # new dimension can go anywhere
+    assert set(unstacked.stack(0).keys()) == set(d.transpose([1, 0]).keys())
+
+
+def test_reshape_negative_dimensions():
+    d = kdict({(0, "a"): 1, (1, "a"): 2})
+    squeezed = d.squeeze(-1)
+    assert squeezed.key_len == 1
+    assert dict(squeezed) == {(0,): 1, (1,): 2}
+    assert dict(d.unstack(-1)) == {(0,): {"a": 1}, (1,): {"a": 2}}
+    assert dict(d.unstack(-1).stack(-1)) == dict(d)
+    assert set(d.unstack(-1).stack(0).keys()) == {("a", 0), ("a", 1)}
+    assert dict(d.transpose([-1, 0])) == {("a", 0): 1, ("a", 1): 2}
+
+    with pytest.raises(ValueError):
+        d.squeeze(2)
+    with pytest.raises(ValueError):
+        d.squeeze(-3)
+    with pytest.raises(ValueError):
+        d.unstack(2)
+    with pytest.raises(ValueError):
+        d.unstack(-1).stack(2)
+    with pytest.raises(ValueError):
+        d.transpose([-1, 1])
+    with pytest.raises(ValueError):
+        d.transpose([0, 2])
+
+
+def test_squeeze_to_zero_dimensions():
+    s = kdict({(0, "a"): 1}).squeeze()
+    assert s.key_len == 0
+    assert s[()] == 1
+    with pytest.raises(KeyError):
+        s[1, 2, 3] = 5
+    assert dict(s) == {(): 1}
+
+    u = kdict({(0,): 1, (1,): 2}).unstack(0)
+    assert u.key_len == 0
+    with pytest.raises(KeyError):
+        u[1, 2] = 5
+
+
+def test_stack_requires_dict_values():
+    with pytest.raises(ValueError):
+        kdict({(0, "a"): 1}).stack()
+
+
+def test_reshape_empty():
+    d = kdict()
+    assert len(d.transpose([])) == 0
+    assert len(d.squeeze()) == 0
+    assert len(d.unstack(0)) == 0
+    assert len(d.stack()) == 0